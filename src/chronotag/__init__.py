@@ -4,75 +4,222 @@ A custom logging utility that provides a centralized logging configuration that
 all log messages with a given string. It also includes special "beacon" logging for timing operations.
 """
 
+import atexit
+import contextlib
+import functools
+import importlib
 import logging
+import os
+import queue
 import sys
 import time
-from logging.handlers import RotatingFileHandler
-
-# Import Google Cloud Logging components conditionally to avoid eager initialization
-# This ensures that `google.cloud.logging.Client()` is not called at module import time
-# unless explicitly enabled later.
-try:
-    import google.cloud.logging
-    from google.cloud.logging.handlers import CloudLoggingHandler
-
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = True
-except ImportError:
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = False
-    print(
-        "Warning: google-cloud-logging not installed. Google Cloud Logging functionality will be disabled.",
-        file=sys.stderr,
-    )
-except Exception as e:
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = False
-    print(
-        f"Warning: Failed to import google.cloud.logging: {e}. Google Cloud Logging functionality will be disabled."
-    )
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Bound once so beacon timers skip the `time` module attribute lookup on every call
+_perf_counter = time.perf_counter
+
+# Level numbers bound as module globals for the isEnabledFor gates in PrefixedLogger
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+_CRITICAL = logging.CRITICAL
+
+# Batching for the Cloud Logging background transport: entries are coalesced into writes of up to
+# _CLOUD_LOGGING_BATCH_SIZE records, waiting at most _CLOUD_LOGGING_MAX_LATENCY seconds for a batch to fill.
+# The transport's grace_period (5 s by default) must stay above the max latency so a pending batch
+# can still be sent on shutdown.
+_CLOUD_LOGGING_BATCH_SIZE = 100
+_CLOUD_LOGGING_MAX_LATENCY = 2.0
+
+# Handler sets ("sinks") keyed on (log_file_path, enable_gcloud_logging, cloud_logger_name). Every logger
+# configured the same way shares one (QueueHandler, QueueListener, cloud handler or None) set, so handlers,
+# listener threads and Cloud Logging clients are only built once per configuration
+_sinks: dict[tuple, tuple] = {}
 
+# Sink key each logger set up by setup_logging is attached to, keyed on logger_name
+_configured_loggers: dict[str, tuple] = {}
 
-# Module-level flag to ensure logging setup runs only once
-_logging_configured = False
+# Rotating file handlers, shared by every sink writing to the same path
+_file_handlers: dict[str, logging.Handler] = {}
+
+# Google Cloud Logging components, imported on first use by _load_cloud_logging();
+# _CLOUD_LOGGING_UNAVAILABLE once the import has failed, so it is neither retried nor warned about again
+_CLOUD_LOGGING_UNAVAILABLE = object()
+_cloud_logging = None
+
+
+def _load_cloud_logging():
+    """
+    Import the Google Cloud Logging components on first use and cache them (or the failure, warning once).
+    The import pulls in gRPC, protobuf and auth, so it is deferred until Cloud Logging is actually enabled
+    instead of running on every `import chronotag`.
+
+    Returns:
+        A (module, CloudLoggingHandler, BackgroundThreadTransport) tuple, or None if the import failed.
+    """
+    global _cloud_logging
+    if _cloud_logging is None:
+        try:
+            cloud_logging = importlib.import_module("google.cloud.logging")
+            from google.cloud.logging.handlers import CloudLoggingHandler
+            from google.cloud.logging_v2.handlers.transports import BackgroundThreadTransport
+        except ImportError:
+            print(
+                "Warning: google-cloud-logging not installed. Google Cloud Logging functionality will be disabled.",
+                file=sys.stderr,
+            )
+            _cloud_logging = _CLOUD_LOGGING_UNAVAILABLE
+        except Exception as e:
+            print(
+                f"Warning: Failed to import google.cloud.logging: {e}. Google Cloud Logging functionality will be disabled."
+            )
+            _cloud_logging = _CLOUD_LOGGING_UNAVAILABLE
+        else:
+            _cloud_logging = (cloud_logging, CloudLoggingHandler, BackgroundThreadTransport)
+    if _cloud_logging is _CLOUD_LOGGING_UNAVAILABLE:
+        return None
+    return _cloud_logging
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that only checks for rollover every `check_every` records.
+    The stock handler stats and seeks the log file on every emit; in exchange for skipping that,
+    the file may grow past maxBytes by up to `check_every - 1` records before it is rotated.
+    """
+
+    def __init__(self, *args, check_every=64, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._check_every = check_every
+        self._records_since_check = 0
+
+    def shouldRollover(self, record):
+        """Only defer to the stat/seek based check on every `check_every`-th record."""
+        self._records_since_check += 1
+        if self._records_since_check < self._check_every:
+            return False
+        self._records_since_check = 0
+        return super().shouldRollover(record)
 
 
 class PrefixedLogger:
     """A logger wrapper that automatically prefixes messages with a given string."""
 
+    # Fixed attribute layout: no per-instance __dict__, and attribute access goes through slot descriptors
+    __slots__ = (
+        "logger",
+        "_prefix",
+        "_has_prefix",
+        "_prefix_text",
+        "_prefix_token",
+        "_blip_template",
+        "_start_template",
+        "_end_template",
+        "_end_na_template",
+        "_start_times",
+        "_fast_start_times",
+        "_fast_keys",
+        "_fast_free_tokens",
+        "_info",
+        "_debug",
+        "_warning",
+        "_error",
+        "_critical",
+        "_exception",
+        "_isEnabledFor",
+    )
+
     def __init__(self, logger_name, prefix=None):
         self.logger = logging.getLogger(logger_name)
-        self._prefix = prefix or "no-prefix"
+        # Bind the underlying logger methods once to skip the attribute lookup on every call
+        self._info = self.logger.info
+        self._debug = self.logger.debug
+        self._warning = self.logger.warning
+        self._error = self.logger.error
+        self._critical = self.logger.critical
+        self._exception = self.logger.exception
+        self._isEnabledFor = self.logger.isEnabledFor
+        self.update_prefix(prefix)
         self._start_times = {}  # For beacon timers
+        # Token-indexed timer pool for log_start_fast/log_end_fast
+        self._fast_start_times = []
+        self._fast_keys = []
+        self._fast_free_tokens = []
 
-    def _format_message(self, message):
-        """Add prefix to the message."""
-        return f"[{self._prefix}] {message}"
+    def _format_message(self, message, args):
+        """
+        Add the prefix to the message, returning the message and arguments to pass to the logger.
+        With arguments, the message stays a %-style template that the logging framework fills in only
+        when a handler formats the record. Without arguments logging never applies `%`, so the prefix
+        is simply prepended and each distinct message remains its own record.msg.
+        Like logging itself, non-string messages such as exception objects are converted with str().
+        """
+        if not args:
+            return self._prefix_text + str(message), args
+        return self._prefix_token + str(message), args
 
     def update_prefix(self, prefix):
         """Update the prefix for log messages."""
         self._prefix = prefix or "no-prefix"
+        # Without a prefix, messages are passed through untouched instead of getting "[no-prefix] "
+        self._has_prefix = bool(prefix)
+        # Precompute the bracketed prefix once; the token is escaped so it can sit inside a %-style template.
+        self._prefix_text = "[" + self._prefix + "] " if self._has_prefix else ""
+        self._prefix_token = "[" + self._prefix.replace("%", "%%") + "] " if self._has_prefix else ""
+        # Beacon templates are filled in by the logging framework, only when a record is emitted
+        self._blip_template = self._prefix_token + "(BEACON - [%s] - BLIP) %s"
+        self._start_template = self._prefix_token + "(BEACON - [%s] - START) %s"
+        self._end_template = self._prefix_token + "(BEACON - [%s] - END (Elapsed time %.2f s)) %s"
+        self._end_na_template = self._prefix_token + "(BEACON - [%s] - END (Elapsed time N/A s)) %s"
 
     def info(self, message, *args, **kwargs):
         """Log an info message with prefix."""
-        self.logger.info(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_INFO):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._info(message, *args, **kwargs)
 
     def debug(self, message, *args, **kwargs):
         """Log a debug message with prefix."""
-        self.logger.debug(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_DEBUG):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._debug(message, *args, **kwargs)
 
     def warning(self, message, *args, **kwargs):
         """Log a warning message with prefix."""
-        self.logger.warning(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_WARNING):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._warning(message, *args, **kwargs)
 
     def error(self, message, *args, **kwargs):
         """Log an error message with prefix."""
-        self.logger.error(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_ERROR):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._error(message, *args, **kwargs)
 
     def critical(self, message, *args, **kwargs):
         """Log a critical message with prefix."""
-        self.logger.critical(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_CRITICAL):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._critical(message, *args, **kwargs)
 
     def exception(self, message, *args, **kwargs):
         """Log an exception message with prefix."""
-        self.logger.exception(self._format_message(message), *args, **kwargs)
+        if not self._isEnabledFor(_ERROR):
+            return
+        if self._has_prefix:
+            message, args = self._format_message(message, args)
+        self._exception(message, *args, **kwargs)
 
     def log_beacon(self, key, message, *args, **kwargs):
         """
@@ -81,8 +228,13 @@ class PrefixedLogger:
             key: A unique string key to identify the operation.
             message: The log message.
         """
-        beacon_message = f"(BEACON - [{key}] - BLIP) {message}"
-        self.info(beacon_message, *args, **kwargs)
+        if not self._isEnabledFor(_INFO):
+            return
+        if args:
+            # The message is a template for its own arguments, so it cannot be passed as one
+            self.info(f"(BEACON - [{key}] - BLIP) {message}", *args, **kwargs)
+        else:
+            self._info(self._blip_template, key, message, **kwargs)
 
     def log_b(self, key, message, *args, **kwargs):
         return self.log_beacon(key, message, *args, **kwargs)
@@ -94,9 +246,16 @@ class PrefixedLogger:
             key: A unique string key to identify the operation.
             message: The log message.
         """
-        self._start_times[key] = time.perf_counter()
-        beacon_message = f"(BEACON - [{key}] - START) {message}"
-        self.info(beacon_message, *args, **kwargs)
+        self._start_times[key] = _perf_counter()
+        if self._isEnabledFor(_INFO):
+            self._log_start_beacon(key, message, args, kwargs)
+
+    def _log_start_beacon(self, key, message, args, kwargs):
+        """Log a START beacon."""
+        if args:
+            self.info(f"(BEACON - [{key}] - START) {message}", *args, **kwargs)
+        else:
+            self._info(self._start_template, key, message, **kwargs)
 
     def log_end(self, key, message, *args, **kwargs):
         """
@@ -108,13 +267,96 @@ class PrefixedLogger:
         start_time = self._start_times.pop(key, None)
         if start_time is None:
             self.warning(
-                f"log_end called for key '{key}' without a corresponding log_start."
+                "log_end called for key '%s' without a corresponding log_start.", key
+            )
+        if not self._isEnabledFor(_INFO):
+            return
+        if start_time is None:
+            if args:
+                self.info(f"(BEACON - [{key}] - END (Elapsed time N/A s)) {message}", *args, **kwargs)
+            else:
+                self._info(self._end_na_template, key, message, **kwargs)
+        else:
+            self._log_end_elapsed(key, _perf_counter() - start_time, message, args, kwargs)
+
+    def _log_end_elapsed(self, key, elapsed_time, message, args, kwargs):
+        """
+        Log an END beacon with the given elapsed time.
+        Callers check that INFO is enabled first, so a filtered END beacon only pops its timer and
+        never reads the clock or builds the message.
+        """
+        if args:
+            self.info(
+                f"(BEACON - [{key}] - END (Elapsed time {elapsed_time:.2f} s)) {message}",
+                *args,
+                **kwargs,
             )
-            beacon_message = f"(BEACON - [{key}] - END (Elapsed time N/A s)) {message}"
         else:
-            elapsed_time = time.perf_counter() - start_time
-            beacon_message = f"(BEACON - [{key}] - END (Elapsed time {elapsed_time:.2f} s)) {message}"
-        self.info(beacon_message, *args, **kwargs)
+            self._info(self._end_template, key, elapsed_time, message, **kwargs)
+
+    def log_start_fast(self, key, message, *args, **kwargs):
+        """
+        Logs a START beacon like log_start, but returns an integer token for log_end_fast.
+        The timer is stored in a list slot indexed by the token, so tight loops never hash string keys.
+        Slots are recycled once ended; this pool is not thread-safe.
+        Args:
+            key: A string key to identify the operation in the beacon messages.
+            message: The log message.
+
+        Returns:
+            Token to pass to log_end_fast.
+        """
+        if self._fast_free_tokens:
+            token = self._fast_free_tokens.pop()
+            self._fast_keys[token] = key
+            self._fast_start_times[token] = _perf_counter()
+        else:
+            token = len(self._fast_start_times)
+            self._fast_keys.append(key)
+            self._fast_start_times.append(_perf_counter())
+        if self._isEnabledFor(_INFO):
+            self._log_start_beacon(key, message, args, kwargs)
+        return token
+
+    def log_end_fast(self, token, message, *args, **kwargs):
+        """
+        Logs an END beacon for a timer started with log_start_fast and reports the elapsed time.
+        Args:
+            token: The token returned by log_start_fast.
+            message: The log message.
+        """
+        start_times = self._fast_start_times
+        if not 0 <= token < len(start_times) or start_times[token] is None:
+            self.warning(
+                "log_end_fast called with token %s without a running log_start_fast timer.", token
+            )
+            return
+        start_time = start_times[token]
+        key = self._fast_keys[token]
+        start_times[token] = None
+        self._fast_keys[token] = None
+        self._fast_free_tokens.append(token)
+        if self._isEnabledFor(_INFO):
+            self._log_end_elapsed(key, _perf_counter() - start_time, message, args, kwargs)
+
+    @contextlib.contextmanager
+    def beacon(self, key, message, *args, **kwargs):
+        """
+        Context manager that logs START and END beacons around the enclosed block.
+        The start time lives on the stack instead of in the timer dict, so balanced pairs stay cheap;
+        use log_start/log_end when the timer has to span different frames.
+        Args:
+            key: A unique string key to identify the operation.
+            message: The log message.
+        """
+        start_time = _perf_counter()
+        if self._isEnabledFor(_INFO):
+            self._log_start_beacon(key, message, args, kwargs)
+        try:
+            yield
+        finally:
+            if self._isEnabledFor(_INFO):
+                self._log_end_elapsed(key, _perf_counter() - start_time, message, args, kwargs)
 
 
 def setup_logging(
@@ -127,74 +369,186 @@ def setup_logging(
 ):
     """
     Set up logging configuration with both cloud and file handlers.
-    This function ensures handlers are added only once.
+    Loggers configured with the same log_file_path, enable_gcloud_logging and cloud_logger_name share one set
+    of handlers, built on first use; configuring the same logger differently replaces its earlier handlers.
+    The stream and file handlers run on a background QueueListener thread; the logger itself only enqueues
+    records for them. The Cloud Logging handler is attached to the logger directly, since it captures request
+    and trace data from the calling thread and already sends entries from its own background transport.
 
     Args:
         logger_name: Name of the logger
-        cloud_logger_name: Name for the cloud logging handler (used by Google Cloud Logging)
+        cloud_logger_name: Name for the cloud logging handler (used by Google Cloud Logging). Defaults to the
+                           name of the first logger set up with this configuration.
         enable_gcloud_logging: If True, attempts to set up Google Cloud Logging.
                                Set to False to avoid Google Cloud Logging initialization overhead.
-        log_file_path: Path to the log file for RotatingFileHandler.
+        log_file_path: Path to the log file for RotatingFileHandler. All configurations writing to the same
+                       file share one handler, so the rotation settings of the first one are kept.
         log_file_max_bytes: Maximum size of the log file before rotation (in bytes).
         log_file_backup_count: Number of backup log files to keep.
 
     Returns:
         Configured logger instance
     """
-    global _logging_configured
-    if _logging_configured:
-        # If already configured, just return the existing logger without re-adding handlers
-        return logging.getLogger(logger_name)
+    if log_file_path is not None:
+        # Normalize like RotatingFileHandler.baseFilename does, so every spelling of a path shares one handler
+        log_file_path = os.path.abspath(log_file_path)
+        file_handler = _file_handlers.get(log_file_path)
+        if file_handler is not None and (file_handler.maxBytes, file_handler.backupCount) != (
+            log_file_max_bytes,
+            log_file_backup_count,
+        ):
+            print(
+                f"Warning: {log_file_path} is already used by another logger configuration; "
+                f"keeping its rotation settings (maxBytes={file_handler.maxBytes}, "
+                f"backupCount={file_handler.backupCount})."
+            )
+    sink_key = (log_file_path, enable_gcloud_logging, cloud_logger_name)
+    logger = logging.getLogger(logger_name)
+    if _configured_loggers.get(logger_name) == sink_key:
+        # If already configured this way, just return the existing logger without re-adding handlers
+        return logger
+
+    sink = _sinks.get(sink_key)
+    sink_created = sink is None
+    if sink_created:
+        sink = _create_sink(
+            cloud_logger_name or logger_name,
+            enable_gcloud_logging,
+            log_file_path,
+            log_file_max_bytes,
+            log_file_backup_count,
+        )
+        _sinks[sink_key] = sink
+
+    # A logger follows its latest configuration, so drop the handlers of any earlier one
+    _remove_configuration(logger_name)
+
+    # Attach directly to the named logger; records are not propagated to the root logger, so other
+    # libraries' records never reach our file/cloud handlers and ours skip the walk up the hierarchy
+    queue_handler, queue_listener, cloud_handler = sink
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    if cloud_handler is not None:
+        logger.addHandler(cloud_handler)
+    _configured_loggers[logger_name] = sink_key
+
+    if sink_created:
+        handlers = list(queue_listener.handlers)
+        if cloud_handler is not None:
+            handlers.append(cloud_handler)
+        logger.info("LLL Logging initialized %s", handlers)
+
+    return logger
 
+
+def _create_sink(cloud_log_name, enable_gcloud_logging, log_file_path, log_file_max_bytes, log_file_backup_count):
+    """
+    Build the handlers for one logging configuration.
+
+    Args:
+        cloud_log_name: Name for the cloud logging handler
+        enable_gcloud_logging: If True, attempts to set up Google Cloud Logging.
+        log_file_path: Path to the log file, or None to disable file logging.
+        log_file_max_bytes: Maximum size of the log file before rotation (in bytes).
+        log_file_backup_count: Number of backup log files to keep.
+
+    Returns:
+        A (QueueHandler, QueueListener, cloud handler or None) tuple; the listener is already started
+    """
     handlers: list[logging.Handler] = [logging.StreamHandler()]
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-    # Conditionally initialize Google Cloud Logging client
+    # Conditionally import and initialize Google Cloud Logging client
     cloud_handler = None
-    if enable_gcloud_logging and _GOOGLE_CLOUD_LOGGING_AVAILABLE:
+    cloud_logging_components = _load_cloud_logging() if enable_gcloud_logging else None
+    if cloud_logging_components is not None:
+        cloud_logging, CloudLoggingHandler, BackgroundThreadTransport = cloud_logging_components
         try:
-            client = google.cloud.logging.Client()
+            client = cloud_logging.Client()
             cloud_handler = CloudLoggingHandler(
-                client, name=cloud_logger_name or logger_name
+                client,
+                name=cloud_log_name,
+                transport=functools.partial(
+                    BackgroundThreadTransport,
+                    batch_size=_CLOUD_LOGGING_BATCH_SIZE,
+                    max_latency=_CLOUD_LOGGING_MAX_LATENCY,
+                ),
             )
-            handlers.append(cloud_handler)
+            # The cloud handler stays on the caller's thread: its filter reads the current web request and
+            # trace span there, and its BackgroundThreadTransport already moves the network I/O off-thread.
+            cloud_handler.setFormatter(formatter)
         except Exception as e:
             print(
                 f"Notice: Could not initialize Google Cloud Logging. Functionality disabled: {e}"
             )
-    elif enable_gcloud_logging and not _GOOGLE_CLOUD_LOGGING_AVAILABLE:
-        print(
-            "Warning: Google Cloud Logging requested but library is not available or failed to import."
-        )
 
-    rotation_handler = None
     if log_file_path is not None:
-        try:
-            rotation_handler = RotatingFileHandler(
-                log_file_path,
-                maxBytes=log_file_max_bytes,
-                backupCount=log_file_backup_count,
-            )
-            handlers.append(rotation_handler)
-        except Exception as e:
-            print(
-                f"Warning: Failed to initialize RotatingFileHandler: {e}. File logging is disabled."
-            )
-            rotation_handler = None  # Ensure it's None if creation failed
-
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=handlers,
-        force=True,  # We re-enable force=True here because _logging_configured prevents redundant setups.
-    )
-
-    logging.info(f"LLL Logging initialized {handlers}")
-
-    # Set the flag to True after successful configuration
-    _logging_configured = True
+        # Reuse the handler if another sink already writes to this file, so that two
+        # handlers never rotate the same file underneath each other
+        file_handler = _file_handlers.get(log_file_path)
+        if file_handler is None:
+            try:
+                file_handler = FastRotatingFileHandler(
+                    log_file_path,
+                    maxBytes=log_file_max_bytes,
+                    backupCount=log_file_backup_count,
+                )
+                _file_handlers[log_file_path] = file_handler
+            except Exception as e:
+                print(
+                    f"Warning: Failed to initialize RotatingFileHandler: {e}. File logging is disabled."
+                )
+        if file_handler is not None:
+            handlers.append(file_handler)
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # The stream and file handlers are fed from a background thread; the logger only gets a QueueHandler.
+    # The QueueHandler keeps a bare message formatter so the full format is applied once, downstream.
+    # Its prepare() also merges `msg % args` into the record once, on the caller's thread, before it is
+    # queued, so the stream and file handlers both reuse that message instead of each re-running the
+    # substitution. The merge replaces the template, so handlers that group on it belong on the logger.
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_listener.start()
+    # Drain the queue into the handlers on interpreter exit (runs before logging.shutdown closes them)
+    atexit.register(queue_listener.stop)
+
+    return queue_handler, queue_listener, cloud_handler
+
+
+def _remove_configuration(logger_name):
+    """
+    Detach the handlers an earlier setup_logging call attached to the named logger.
+    Once no logger uses that configuration anymore, its listener is stopped and its stream and cloud
+    handlers are closed; shared file handlers are left open for the other sinks writing to the same path.
 
-    return logging.getLogger(logger_name)
+    Args:
+        logger_name: Name of the logger
+    """
+    sink_key = _configured_loggers.pop(logger_name, None)
+    if sink_key is None:
+        return
+    queue_handler, queue_listener, cloud_handler = _sinks[sink_key]
+    logger = logging.getLogger(logger_name)
+    logger.removeHandler(queue_handler)
+    if cloud_handler is not None:
+        logger.removeHandler(cloud_handler)
+
+    if sink_key in _configured_loggers.values():
+        return
+    del _sinks[sink_key]
+    atexit.unregister(queue_listener.stop)
+    queue_listener.stop()
+    for handler in queue_listener.handlers:
+        if handler not in _file_handlers.values():
+            handler.close()
+    if cloud_handler is not None:
+        cloud_handler.close()
 
 
 def get_prefixed_logger(
@@ -208,7 +562,7 @@ def get_prefixed_logger(
 ):
     """
     Get a prefixed logger instance.
-    The first call will set up the base logging configuration.
+    The first call for each logger configuration sets up its logging handlers.
 
     Args:
         logger_name: Name of the logger
@@ -1,8 +1,9 @@
 import logging
 import os
+import re
 import time
 import pytest
-from chronotag import get_prefixed_logger, PrefixedLogger
+from chronotag import get_prefixed_logger, FastRotatingFileHandler, PrefixedLogger
 
 # Helper to capture logs
 class ListHandler(logging.Handler):
@@ -23,6 +24,12 @@ def test_initialization():
     assert isinstance(logger, PrefixedLogger)
     assert logger._prefix == "TEST"
 
+def test_no_instance_dict():
+    logger = get_prefixed_logger("test_slots", prefix="SLOTS")
+    assert not hasattr(logger, "__dict__")
+    with pytest.raises(AttributeError):
+        logger.unexpected = True
+
 def test_prefixing(log_capture):
     logger = get_prefixed_logger("test_prefix", prefix="MY-PREFIX")
     logger.logger.addHandler(log_capture)
@@ -60,6 +67,20 @@ def test_beacon_start_end(log_capture):
     assert "(BEACON - [op1] - END (Elapsed time" in log_capture.records[1].getMessage()
     assert "Ending operation" in log_capture.records[1].getMessage()
 
+def test_beacon_context_manager(log_capture):
+    logger = get_prefixed_logger("test_beacon_cm", prefix="CM")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    with pytest.raises(RuntimeError):
+        with logger.beacon("op2", "Scoped operation"):
+            raise RuntimeError("boom")
+
+    assert len(log_capture.records) == 2
+    assert "[CM] (BEACON - [op2] - START) Scoped operation" in log_capture.records[0].getMessage()
+    assert "(BEACON - [op2] - END (Elapsed time" in log_capture.records[1].getMessage()
+    assert logger._start_times == {}
+
 def test_beacon_blip(log_capture):
     logger = get_prefixed_logger("test_blip", prefix="BLIP")
     logger.logger.addHandler(log_capture)
@@ -92,3 +113,366 @@ def test_log_end_without_start(log_capture):
     
     # Check for the beacon message with N/A time
     assert any("Elapsed time N/A s" in m for m in messages)
+
+def test_filtered_level_skips_formatting(log_capture, monkeypatch):
+    logger = get_prefixed_logger("test_filtered", prefix="QUIET")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.WARNING)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("message built for a filtered level")
+
+    # Prefixed messages go through _format_message; argument-less beacons pass their templates to _info
+    monkeypatch.setattr(PrefixedLogger, "_format_message", fail)
+    monkeypatch.setattr(logger, "_debug", fail)
+    monkeypatch.setattr(logger, "_info", fail)
+    logger.debug("Not emitted")
+    logger.info("Not emitted")
+    logger.log_beacon("event", "Not emitted")
+    logger.log_beacon("event", "Not emitted %s", "with args")
+    logger.log_start("op", "Not emitted")
+    logger.log_end("op", "Not emitted")
+    logger.log_end_fast(logger.log_start_fast("fast_op", "Not emitted"), "Not emitted")
+    with logger.beacon("scoped", "Not emitted"):
+        pass
+
+    assert log_capture.records == []
+
+def test_prefix_is_applied_lazily(log_capture):
+    logger = get_prefixed_logger("test_lazy", prefix="LAZY")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    logger.info("Calling API path %s", "/v1/items")
+    logger.info("100% literal")
+    logger.info("%(user)s logged in", {"user": "alice"})
+
+    assert [r.getMessage() for r in log_capture.records] == [
+        "[LAZY] Calling API path /v1/items",
+        "[LAZY] 100% literal",
+        "[LAZY] alice logged in",
+    ]
+    assert log_capture.records[0].msg.endswith("Calling API path %s")
+
+def test_argless_messages_keep_distinct_msg(log_capture):
+    logger = get_prefixed_logger("test_argless_msg", prefix="P")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    logger.error("DB down")
+    logger.error("Disk full")
+
+    assert [r.msg for r in log_capture.records] == ["[P] DB down", "[P] Disk full"]
+    assert all(r.args == () for r in log_capture.records)
+
+def test_non_string_messages_are_prefixed(log_capture):
+    logger = get_prefixed_logger("test_non_string", prefix="EXC")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        logger.error(e)
+        logger.exception(e)
+    logger.info(42)
+    logger.info(ValueError("code %d"), 7)
+
+    assert [r.getMessage() for r in log_capture.records] == [
+        "[EXC] boom",
+        "[EXC] boom",
+        "[EXC] 42",
+        "[EXC] code 7",
+    ]
+    assert log_capture.records[1].exc_info is not None
+
+def test_prefix_with_percent_sign(log_capture):
+    logger = get_prefixed_logger("test_percent_prefix", prefix="100%")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    logger.info("Progress %d", 5)
+    logger.update_prefix(None)
+    logger.info("Done")
+
+    assert log_capture.records[0].getMessage() == "[100%] Progress 5"
+    assert log_capture.records[1].getMessage() == "Done"
+
+def test_setup_logging_uses_queue_listener():
+    import chronotag
+    from logging.handlers import QueueHandler
+
+    logger = get_prefixed_logger("test_queue", prefix="QUEUE")
+
+    _, listener, _ = chronotag._sinks[(os.path.abspath("logs.txt"), False, None)]
+    [queue_handler] = logger.logger.handlers
+    assert isinstance(queue_handler, QueueHandler)
+    assert queue_handler.queue is listener.queue
+    assert any(isinstance(h, logging.StreamHandler) for h in listener.handlers)
+
+def test_file_records_are_written_without_buffering(tmp_path):
+    import chronotag
+
+    log_file = tmp_path / "unbuffered.log"
+    logger = get_prefixed_logger("test_unbuffered", prefix="FILE", log_file_path=str(log_file))
+
+    _, listener, _ = chronotag._sinks[(str(log_file), False, None)]
+    file_handlers = [h for h in listener.handlers if isinstance(h, FastRotatingFileHandler)]
+    assert len(file_handlers) == 1
+    assert file_handlers[0].formatter is not None
+
+    logger.info("Visible right away")
+    deadline = time.monotonic() + 5
+    while "[FILE] Visible right away" not in log_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "[FILE] Visible right away" in log_file.read_text()
+
+def test_beacon_formatting_is_deferred(log_capture):
+    logger = get_prefixed_logger("test_beacon_lazy", prefix="LAZY")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    logger.log_beacon("event", "100% done")
+    logger.log_start("op", "Starting %s", "job")
+    logger.log_end("op", "Finished")
+
+    blip, start, end = log_capture.records
+    assert blip.args == ("event", "100% done")
+    assert blip.getMessage() == "[LAZY] (BEACON - [event] - BLIP) 100% done"
+    assert start.getMessage() == "[LAZY] (BEACON - [op] - START) Starting job"
+    assert end.args[0] == "op"
+    assert isinstance(end.args[1], float)
+    assert re.fullmatch(r"\[LAZY\] \(BEACON - \[op\] - END \(Elapsed time \d+\.\d{2} s\)\) Finished", end.getMessage())
+
+def test_cloud_logging_not_imported_by_default():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, chronotag; "
+        "chronotag.get_prefixed_logger('test_no_cloud', log_file_path=None); "
+        "print('google.cloud.logging' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+def test_fast_beacon_tokens(log_capture):
+    logger = get_prefixed_logger("test_fast_beacon", prefix="FAST")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    first = logger.log_start_fast("op1", "Starting first")
+    second = logger.log_start_fast("op2", "Starting second")
+    logger.log_end_fast(first, "Ending first")
+    third = logger.log_start_fast("op3", "Starting third")
+    logger.log_end_fast(second, "Ending second")
+    logger.log_end_fast(third, "Ending third")
+    logger.log_end_fast(third, "Ending twice")
+
+    assert first != second
+    assert third == first  # Ended slots are reused
+    messages = [r.getMessage() for r in log_capture.records]
+    assert "[FAST] (BEACON - [op1] - END (Elapsed time" in messages[2]
+    assert "[FAST] (BEACON - [op2] - END (Elapsed time" in messages[4]
+    assert "[FAST] (BEACON - [op3] - END (Elapsed time" in messages[5]
+    assert log_capture.records[6].levelno == logging.WARNING
+    assert len(messages) == 7
+
+def test_queued_records_are_merged_once(monkeypatch):
+    import threading
+    import chronotag
+
+    received = []
+    done = threading.Event()
+
+    class ListenerCapture(logging.Handler):
+        def handle(self, record):
+            received.append((record.msg, record.args))
+            done.set()
+
+    get_prefixed_logger("test_merged", prefix="MERGED", log_file_path=None)
+    _, listener, _ = chronotag._sinks[(None, False, None)]
+    monkeypatch.setattr(listener, "handlers", listener.handlers + (ListenerCapture(),))
+    # Wait for the setup message to drain so only the call below is captured
+    listener.queue.put_nowait(logging.makeLogRecord({"msg": "drain", "levelno": logging.INFO}))
+    assert done.wait(5)
+    received.clear()
+    done.clear()
+
+    PrefixedLogger("test_merged", prefix="MERGED").info("Value %d", 7)
+
+    assert done.wait(5)
+    assert received == [("[MERGED] Value 7", None)]
+
+def test_handlers_attached_to_named_logger_only():
+    from logging.handlers import QueueHandler
+
+    first = get_prefixed_logger("test_scoped_a", prefix="A")
+    second = get_prefixed_logger("test_scoped_b", prefix="B")
+
+    for logger in (first, second):
+        assert any(isinstance(h, QueueHandler) for h in logger.logger.handlers)
+        assert logger.logger.propagate is False
+    assert not any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+
+def test_setup_logging_caches_per_configuration(tmp_path, monkeypatch):
+    import threading
+    import chronotag
+
+    first_file = str(tmp_path / "first.log")
+    second_file = str(tmp_path / "second.log")
+
+    threads_before = threading.active_count()
+    logger = chronotag.setup_logging("test_config_a", enable_gcloud_logging=False, log_file_path=first_file)
+    handlers = list(logger.handlers)
+    assert chronotag.setup_logging("test_config_a", enable_gcloud_logging=False, log_file_path=first_file) is logger
+    assert logger.handlers == handlers
+
+    # Other loggers configured the same way share the handlers and listener thread
+    for name in ("test_config_b", "test_config_c", "test_config_d"):
+        other = chronotag.setup_logging(name, enable_gcloud_logging=False, log_file_path=first_file)
+        assert other.handlers == handlers
+    assert threading.active_count() == threads_before + 1
+
+    # Reconfiguring a logger replaces its earlier handlers instead of adding to them
+    _, first_listener, _ = chronotag._sinks[(first_file, False, None)]
+    chronotag.setup_logging("test_config_a", enable_gcloud_logging=False, log_file_path=second_file)
+    assert len(logger.handlers) == 1
+    assert logger.handlers != handlers
+    assert chronotag._configured_loggers["test_config_a"] == (second_file, False, None)
+
+    # The old handlers keep running while other loggers still use them...
+    handled = []
+    handled_event = threading.Event()
+
+    class ListenerCapture(logging.Handler):
+        def handle(self, record):
+            handled.append(record.msg)
+            handled_event.set()
+
+    monkeypatch.setattr(first_listener, "handlers", first_listener.handlers + (ListenerCapture(),))
+    first_listener.queue.put_nowait(logging.makeLogRecord({"msg": "before", "levelno": logging.INFO}))
+    assert handled_event.wait(5)
+    assert (first_file, False, None) in chronotag._sinks
+
+    # ...and are torn down once no logger uses them anymore
+    for name in ("test_config_b", "test_config_c", "test_config_d"):
+        chronotag.setup_logging(name, enable_gcloud_logging=False, log_file_path=second_file)
+    assert (first_file, False, None) not in chronotag._sinks
+    first_listener.queue.put_nowait(logging.makeLogRecord({"msg": "after", "levelno": logging.INFO}))
+    time.sleep(0.2)
+    assert handled == ["before"]
+
+def test_file_handler_shared_across_path_spellings(tmp_path, monkeypatch, capsys):
+    import chronotag
+
+    monkeypatch.chdir(tmp_path)
+    first = chronotag.setup_logging("test_path_a", enable_gcloud_logging=False, log_file_path="shared.log")
+    second = chronotag.setup_logging(
+        "test_path_b", enable_gcloud_logging=False, log_file_path="./shared.log", log_file_max_bytes=1024
+    )
+
+    shared = str(tmp_path / "shared.log")
+    assert first.handlers == second.handlers
+    assert [path for path in chronotag._file_handlers if path.startswith(str(tmp_path))] == [shared]
+    assert chronotag._file_handlers[shared].maxBytes == 100 * 1024 * 1024
+    assert "keeping its rotation settings" in capsys.readouterr().out
+
+def test_no_prefix_passes_message_through(log_capture):
+    logger = get_prefixed_logger("test_no_prefix")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.INFO)
+
+    logger.info("Plain %s", "message")
+    logger.log_beacon("event", "Something happened")
+
+    assert log_capture.records[0].msg == "Plain %s"
+    assert log_capture.records[0].getMessage() == "Plain message"
+    assert log_capture.records[1].getMessage() == "(BEACON - [event] - BLIP) Something happened"
+
+def test_filtered_log_end_only_pops_timer(log_capture, monkeypatch):
+    import chronotag
+
+    logger = get_prefixed_logger("test_filtered_end", prefix="QUIET")
+    logger.logger.addHandler(log_capture)
+    logger.logger.setLevel(logging.WARNING)
+
+    logger.log_start("op", "Not emitted")
+    token = logger.log_start_fast("fast_op", "Not emitted")
+
+    def fail():
+        raise AssertionError("clock read for a filtered END beacon")
+
+    monkeypatch.setattr(chronotag, "_perf_counter", fail)
+    logger.log_end("op", "Not emitted")
+    logger.log_end_fast(token, "Not emitted")
+
+    assert logger._start_times == {}
+    assert logger._fast_free_tokens == [token]
+    assert log_capture.records == []
+
+def test_fast_rotating_file_handler_checks_periodically(tmp_path):
+    log_file = tmp_path / "fast.log"
+    handler = FastRotatingFileHandler(log_file, maxBytes=1, backupCount=1, check_every=4)
+    record = logging.LogRecord("test_fast_rotation", logging.INFO, __file__, 1, "entry", None, None)
+
+    try:
+        for _ in range(3):
+            handler.handle(record)
+        assert not (tmp_path / "fast.log.1").exists()
+
+        handler.handle(record)
+        assert (tmp_path / "fast.log.1").exists()
+    finally:
+        handler.close()
+
+def test_cloud_handler_sees_caller_thread_request_data(monkeypatch):
+    import threading
+    import types
+    import chronotag
+
+    request_data = threading.local()
+    emitted = []
+
+    class FakeCloudLoggingHandler(logging.Handler):
+        def __init__(self, client, name, transport):
+            super().__init__()
+            self.addFilter(self._add_request_data)
+
+        @staticmethod
+        def _add_request_data(record):
+            # Like CloudLoggingFilter, reads the request/trace data of the current thread
+            record.trace = getattr(request_data, "trace", None)
+            return True
+
+        def emit(self, record):
+            emitted.append(record)
+
+    fake_module = types.SimpleNamespace(Client=lambda: object())
+    monkeypatch.setattr(chronotag, "_load_cloud_logging", lambda: (fake_module, FakeCloudLoggingHandler, object))
+
+    logger = chronotag.setup_logging("test_cloud_trace", enable_gcloud_logging=True, log_file_path=None)
+    request_data.trace = "projects/demo/traces/abc123"
+    logger.info("Handled request")
+    request_data.trace = None
+
+    assert emitted[-1].getMessage() == "Handled request"
+    assert emitted[-1].trace == "projects/demo/traces/abc123"
+
+def test_failed_cloud_import_is_cached(monkeypatch, capsys):
+    import chronotag
+
+    attempts = []
+
+    def failing_import(name):
+        attempts.append(name)
+        raise ImportError(name)
+
+    monkeypatch.setattr(chronotag, "_cloud_logging", None)
+    monkeypatch.setattr(chronotag.importlib, "import_module", failing_import)
+
+    assert chronotag._load_cloud_logging() is None
+    assert chronotag._load_cloud_logging() is None
+
+    assert attempts == ["google.cloud.logging"]
+    assert capsys.readouterr().err.count("Warning:") == 1